@@ -0,0 +1,131 @@
+import streamlit as st
+
+# Page d'accueil : ce module n'importe que streamlit afin d'être affiché
+# immédiatement, sans attendre pandas ni plotly. Le contenu Markdown est
+# assemblé une seule fois, à l'import du module.
+
+COLONNES_ATTENDUES = [
+    "NOM_ETABL", "cd_com", "CD_MIL", "LL_MIL", "ll_com",
+    "nefstat", "id_eleve", "id_classe", "libformatFr",
+    "LL_CYCLE"]
+
+FONCTIONNALITES = [
+    "**📊 Vue d'ensemble**: Statistiques générales et répartition urbain/rural",
+    "**🏫 Analyse Établissements**: Analyse par nom d'établissement, type et milieu",
+    "**👥 Analyse Élèves**: Répartition des élèves par niveau et type d'établissement",
+    "**📍 Analyse Provinciale**: Statistiques détaillées par province",
+    "**📈 Visualisations Personnalisées**: Créez vos propres graphiques",
+    "**🧪 Qualité des Données**: Contrôles de cohérence et liste des lignes en anomalie",
+    "**🔎 Recherche Élève**: Recherche instantanée d'un élève et élèves à inscriptions multiples",
+    "**📅 Comparaison Annuelle**: Écarts et flux d'élèves entre deux exports annuels",
+    "**🔍 Filtres Hiérarchiques**: Filtrage par Milieu → Commune → Établissement → Type → Cycle → Niveau",
+    "**✏️ Renommage des Colonnes**: Personnalisez les noms des colonnes",
+    "**💾 Export des Données**: Téléchargez les rapports et données filtrées"
+]
+
+GUIDE_FILTRES = """
+1. **🌆 Milieu**: Sélectionnez Rural ou Urbain pour filtrer les établissements
+2. **🏘️ Commune**: Les communes disponibles dépendent du milieu sélectionné
+3. **🏫 Établissement**: Les établissements affichés correspondent à la commune choisie (par nom)
+4. **🏛️ Type d'Établissement**: Filtrez par type d'établissement (nouveau filtre)
+5. **🎓 Cycle**: Filtrez par cycle d'enseignement (Préscolaire, Primaire, Secondaire)
+6. **📚 Niveau**: Les niveaux disponibles dépendent du cycle sélectionné
+
+**Note**: Chaque filtre influence les options disponibles dans les filtres suivants pour maintenir la cohérence des données.
+"""
+
+IDENTIFICATION_ELEVES = """
+L'application identifie automatiquement les élèves en comparant les colonnes :
+- **id_eleve** : Identifiant principal de l'élève
+
+**Critères de détection** :
+- Un élève est considéré comme identifié si `id_eleve` est renseigné
+- L'analyse des élèves est disponible par milieu, province, cycle, niveau et type d'établissement
+- Des statistiques détaillées et des visualisations sont générées automatiquement
+"""
+
+EXEMPLE_DONNEES = {
+    'NOM_ETABL': ['École Primaire Al-Wifaq', 'Collège Ibn Battuta', 'École Maternelle Les Palmiers'],
+    'LL_MIL': ['URBAIN', 'RURAL', 'URBAIN'],
+    'll_com': ['MARRAKECH', 'ASAFI', 'MARRAKECH'],
+    'typeEtab': ['École Primaire', 'Collège', 'École Maternelle'],
+    'LL_CYCLE': ['PRIMAIRE', 'SECONDAIRE-COLLEGIAL', 'PRESCOLAIRE'],
+    'libformatFr': ['1° Année Primaire Général', '1° Année Secondaire Collégial Général', 'PRESCOLAIRE'],
+    'id_eleve': ['ELV001', 'ELV002', 'ELV003']
+}
+
+NOUVEAUTES = [
+    "**🏫 NOM_ETABL**: Affichage du nom complet des établissements au lieu des codes",
+    "**🏛️ typeEtab**: Nouveau filtre et analyses par type d'établissement",
+    "**📊 Visualisations enrichies**: Graphiques incluant les types d'établissements",
+    "**🔍 Filtres améliorés**: Filtre hiérarchique par type d'établissement",
+    "**📈 Analyses détaillées**: Statistiques croisées par type, milieu et cycle",
+    "**⚡ Démarrage rapide**: Bibliothèques d'analyse chargées uniquement à l'arrivée d'un fichier"
+]
+
+
+def _liste_markdown(elements):
+    return "\n".join(f"- {element}" for element in elements)
+
+
+def _tableau_markdown(donnees):
+    # Tableau Markdown : évite d'importer pandas pour un simple exemple
+    colonnes = list(donnees)
+    lignes = ["| " + " | ".join(colonnes) + " |", "|" + " --- |" * len(colonnes)]
+    for valeurs in zip(*donnees.values()):
+        lignes.append("| " + " | ".join(valeurs) + " |")
+    return "\n".join(lignes)
+
+
+COLONNES_PRINCIPALES_MD = "\n".join(
+    f"{i}. **{col}**" for i, col in enumerate(COLONNES_ATTENDUES[:6], 1)
+)
+COLONNES_ADDITIONNELLES_MD = "\n".join(
+    f"{i}. **{col}**" for i, col in enumerate(COLONNES_ATTENDUES[6:], 7)
+)
+FONCTIONNALITES_MD = _liste_markdown(FONCTIONNALITES)
+NOUVEAUTES_MD = _liste_markdown(NOUVEAUTES)
+EXEMPLE_MD = _tableau_markdown(EXEMPLE_DONNEES)
+
+
+def afficher_accueil():
+    st.info("👆 Veuillez télécharger votre fichier Excel pour commencer l'analyse.")
+
+    # Affichage des colonnes attendues
+    st.subheader("📋 Colonnes attendues dans votre fichier Excel:")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Colonnes principales :**")
+        st.markdown(COLONNES_PRINCIPALES_MD)
+
+    with col2:
+        st.markdown("**Colonnes additionnelles :**")
+        st.markdown(COLONNES_ADDITIONNELLES_MD)
+
+    st.markdown("---")
+    st.subheader("🎯 Fonctionnalités principales de l'application:")
+    st.markdown(FONCTIONNALITES_MD)
+
+    st.markdown("---")
+    st.subheader("🔍 Guide d'utilisation des filtres hiérarchiques:")
+    st.markdown(GUIDE_FILTRES)
+
+    st.markdown("---")
+    st.subheader("🔄 Identification des élèves:")
+    st.markdown(IDENTIFICATION_ELEVES)
+
+    st.markdown("---")
+    st.info("💡 **Conseil**: Assurez-vous que votre fichier Excel contient toutes les colonnes listées ci-dessus pour une analyse complète.")
+
+    # Exemple de structure de données
+    st.subheader("📋 Exemple de structure des données:")
+    st.markdown(EXEMPLE_MD)
+
+    st.markdown("---")
+    st.subheader("🆕 Nouveautés dans cette version:")
+    st.markdown(NOUVEAUTES_MD)
+
+    st.markdown("---")
+    st.markdown("**📞 Support**: Pour toute question sur l'utilisation de cette application, consultez la documentation ou contactez l'équipe technique.")
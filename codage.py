@@ -0,0 +1,18 @@
+import numpy as np
+import pandas as pd
+
+
+def compter_valeurs_distinctes(groupes, valeurs, nb_groupes):
+    """Nombre de valeurs distinctes par groupe, calculé sur des codes entiers.
+
+    `groupes` et `valeurs` sont des codes issus de pd.factorize (-1 si la
+    valeur manque) ; les lignes incomplètes sont ignorées, comme nunique().
+    Retourne un tableau de longueur `nb_groupes`.
+    """
+    valide = (groupes >= 0) & (valeurs >= 0)
+    if not valide.any():
+        return np.zeros(nb_groupes, dtype=np.intp)
+
+    nb_valeurs = int(valeurs[valide].max()) + 1
+    paires = pd.unique(groupes[valide].astype(np.int64) * nb_valeurs + valeurs[valide])
+    return np.bincount(paires // nb_valeurs, minlength=nb_groupes)
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+
+from codage import compter_valeurs_distinctes
+
+# Niveaux d'agrégation proposés pour la comparaison
+NIVEAUX_COMPARAISON = {
+    'Commune': 'll_com',
+    'Établissement': 'NOM_ETABL',
+    'Cycle': 'LL_CYCLE',
+    'Niveau': 'libformatFr',
+}
+
+# Indicateurs comparés : colonne source -> libellé
+INDICATEURS = {
+    'NOM_ETABL': 'Établissements',
+    'id_classe': 'Classes',
+    'id_eleve': 'Élèves',
+}
+
+
+def _coder(df):
+    # Codage entier de chaque colonne utilisée, une seule fois par année
+    colonnes = list(INDICATEURS) + list(NIVEAUX_COMPARAISON.values())
+    return {col: pd.factorize(df[col]) for col in dict.fromkeys(colonnes)}
+
+
+def _agreger(codes, colonne):
+    # Équivalent de groupby(colonne).nunique() calculé sur les codes entiers
+    groupes, libelles = codes[colonne]
+    agregat = pd.DataFrame(index=pd.Index(libelles, name=colonne))
+    for col, libelle in INDICATEURS.items():
+        agregat[libelle] = compter_valeurs_distinctes(groupes, codes[col][0], len(libelles))
+    return agregat
+
+
+def _identifiants(df):
+    # Identifiants uniques ; une colonne numérique avec des vides est lue en float64,
+    # elle est ramenée en entiers pour rester comparable à une année sans vide
+    ids = df['id_eleve'].dropna()
+    if pd.api.types.is_float_dtype(ids) and (ids % 1 == 0).all():
+        ids = ids.astype(np.int64)
+    return pd.Index(pd.unique(ids))
+
+
+def resumer_annee(df):
+    """Agrégats par niveau et identifiants d'élèves d'une année.
+
+    Calculé une seule fois par fichier : la comparaison n'aligne ensuite que
+    ces résumés, ce qui permet de changer une année sans recalculer l'autre.
+    Retourne un tuple ({niveau: agrégat}, identifiants).
+    """
+    codes = _coder(df)
+    agregats = {niveau: _agreger(codes, colonne) for niveau, colonne in NIVEAUX_COMPARAISON.items()}
+    return agregats, _identifiants(df)
+
+
+def comparer_annees(agregats_precedent, agregats_courant):
+    """Compare les indicateurs des deux années pour chaque niveau d'agrégation.
+
+    Prend les agrégats produits par resumer_annee et retourne un dictionnaire
+    {niveau: DataFrame} ; chaque DataFrame donne, pour chaque indicateur, les
+    valeurs des deux années et leur écart (année courante - année précédente).
+    Les agrégats sont alignés sur leurs libellés, sans jointure ligne à ligne
+    entre les deux fichiers.
+    """
+    comparaisons = {}
+    for niveau in NIVEAUX_COMPARAISON:
+        precedent, courant = agregats_precedent[niveau].align(
+            agregats_courant[niveau], join='outer', fill_value=0
+        )
+
+        comparaison = pd.DataFrame(index=courant.index)
+        for libelle in INDICATEURS.values():
+            comparaison[f'{libelle} (N-1)'] = precedent[libelle].astype(int)
+            comparaison[f'{libelle} (N)'] = courant[libelle].astype(int)
+            comparaison[f'Δ {libelle}'] = comparaison[f'{libelle} (N)'] - comparaison[f'{libelle} (N-1)']
+
+        comparaisons[niveau] = comparaison.sort_values('Δ Élèves', key=np.abs, ascending=False).reset_index()
+
+    return comparaisons
+
+
+def flux_eleves(ids_precedent, ids_courant):
+    """Flux d'élèves entre les deux années par différence d'ensembles hachés sur id_eleve.
+
+    Prend les identifiants produits par resumer_annee et retourne un tuple
+    (resume, nouveaux, sortants) : le nombre d'élèves restés, nouveaux et
+    sortants, puis les identifiants des deux derniers groupes.
+    """
+    # Identifiants lus en nombre dans un fichier et en texte dans l'autre
+    if ids_precedent.dtype != ids_courant.dtype:
+        ids_precedent = ids_precedent.astype(str)
+        ids_courant = ids_courant.astype(str)
+
+    present_avant = ids_courant.isin(ids_precedent)
+    present_apres = ids_precedent.isin(ids_courant)
+
+    nouveaux = ids_courant[~present_avant]
+    sortants = ids_precedent[~present_apres]
+
+    resume = pd.DataFrame({
+        'Flux': ['Restés', 'Nouveaux', 'Sortants'],
+        'Élèves': [int(present_avant.sum()), len(nouveaux), len(sortants)],
+    })
+    return resume, nouveaux, sortants
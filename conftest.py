@@ -0,0 +1,2 @@
+# Présent à la racine pour que pytest ajoute le dossier du projet au sys.path :
+# les tests importent directement les modules de l'application.
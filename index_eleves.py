@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+
+from codage import compter_valeurs_distinctes
+
+
+class IndexEleves:
+    """Index haché id_eleve -> positions des lignes, construit une fois au chargement.
+
+    Les positions sont celles du DataFrame indexé (RangeIndex issu de read_excel) :
+    les sous-ensembles filtrés conservent ces étiquettes, ce qui permet de
+    réutiliser l'index sur n'importe quel filtrage.
+    """
+
+    def __init__(self, df):
+        # Code entier par ligne (-1 si id_eleve manquant) et table de hachage des identifiants
+        self.codes, uniques = pd.factorize(df['id_eleve'])
+        self.identifiants = pd.Index(uniques)
+
+        # Positions regroupées par élève : ordre[debuts[c]:debuts[c + 1]] pour le code c
+        self.ordre = np.argsort(self.codes, kind='stable')
+        nb_lignes = np.bincount(self.codes[self.codes >= 0], minlength=len(self.identifiants))
+        self.debuts = np.concatenate([[0], np.cumsum(nb_lignes)]) + int((self.codes < 0).sum())
+
+    def __len__(self):
+        return len(self.identifiants)
+
+    def _code(self, id_eleve):
+        # Recherche O(1) ; tolère un identifiant saisi en texte pour une colonne numérique
+        candidats = [id_eleve]
+        if isinstance(id_eleve, str):
+            id_eleve = id_eleve.strip()
+            candidats = [id_eleve]
+            if id_eleve.lstrip('-').isdigit():
+                candidats.append(int(id_eleve))
+        for candidat in candidats:
+            if candidat in self.identifiants:
+                return self.identifiants.get_loc(candidat)
+        return None
+
+    def positions(self, id_eleve):
+        code = self._code(id_eleve)
+        if code is None:
+            return np.array([], dtype=np.intp)
+        return self.ordre[self.debuts[code]:self.debuts[code + 1]]
+
+    def lignes(self, df, id_eleve):
+        return df.iloc[self.positions(id_eleve)]
+
+    def nb_eleves(self, index_lignes=None):
+        # Nombre d'élèves distincts, sur tout le fichier ou sur un sous-ensemble de lignes
+        if index_lignes is None:
+            return len(self.identifiants)
+        codes = self.codes[np.asarray(index_lignes)]
+        codes = codes[codes >= 0]
+        if len(codes) == 0:
+            return 0
+        return int(np.count_nonzero(np.bincount(codes, minlength=len(self.identifiants))))
+
+    def multi_inscriptions(self, df):
+        """Élèves inscrits dans plusieurs établissements ou plusieurs classes."""
+        nb = len(self.identifiants)
+        nb_etabs = compter_valeurs_distinctes(self.codes, pd.factorize(df['NOM_ETABL'])[0], nb)
+        nb_classes = compter_valeurs_distinctes(self.codes, pd.factorize(df['id_classe'])[0], nb)
+        multiples = np.flatnonzero((nb_etabs > 1) | (nb_classes > 1))
+
+        if len(multiples) == 0:
+            return pd.DataFrame(columns=['id_eleve', 'Établissements', 'Classes', 'Liste des établissements'])
+
+        # Détail uniquement pour les élèves concernés, regroupé par tri plutôt que par groupby
+        masque = np.isin(self.codes, multiples)
+        detail = pd.DataFrame({
+            'code': self.codes[masque],
+            'NOM_ETABL': df.loc[masque, 'NOM_ETABL'].to_numpy(),
+        }).dropna().drop_duplicates()
+        detail['NOM_ETABL'] = detail['NOM_ETABL'].astype(str)
+        detail = detail.sort_values(['code', 'NOM_ETABL'])
+        codes_detail = detail['code'].to_numpy()
+        noms = detail['NOM_ETABL'].tolist()
+        debuts = np.flatnonzero(np.diff(codes_detail, prepend=-1)).tolist()
+        fins = debuts[1:] + [len(noms)]
+        liste_etabs = pd.Series(
+            [' | '.join(noms[debut:fin]) for debut, fin in zip(debuts, fins)],
+            index=codes_detail[debuts],
+            dtype=object,
+        )
+
+        rapport = pd.DataFrame({
+            'id_eleve': self.identifiants[multiples],
+            'Établissements': nb_etabs[multiples],
+            'Classes': nb_classes[multiples],
+            'Liste des établissements': liste_etabs.reindex(multiples).to_numpy(),
+        })
+        return rapport.sort_values(['Établissements', 'Classes'], ascending=False, ignore_index=True)
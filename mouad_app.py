@@ -1,9 +1,21 @@
+import time
+debut_execution = time.perf_counter()
+
+import hashlib
+import importlib
+import os
+import sys
+import threading
+from io import BytesIO
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import numpy as np
+from streamlit.logger import get_logger
+
+logger = get_logger(__name__)
+
+# pandas, numpy et plotly ne sont importés qu'à l'arrivée d'un fichier :
+# la page d'accueil (module accueil) ne dépend que de streamlit. Les fonctions
+# mises en cache importent elles-mêmes les modules d'analyse dont elles ont besoin.
 
 # Configuration de la page
 st.set_page_config(
@@ -12,6 +24,77 @@ st.set_page_config(
     layout="wide"
 )
 
+def debut_processus():
+    # Horodatage du lancement du processus serveur (Linux : /proc), None si indisponible
+    try:
+        with open('/proc/self/stat') as stat:
+            debut_ticks = int(stat.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as uptime:
+            secondes_depuis_boot = float(uptime.read().split()[0])
+        return time.time() - secondes_depuis_boot + debut_ticks / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+# Démarrage à froid mesuré une seule fois par processus, au premier affichage complet :
+# durée entre le lancement du serveur et la fin de la première exécution du script
+@st.cache_resource(show_spinner=False)
+def mesurer_demarrage():
+    debut = debut_processus()
+    if debut is None:
+        logger.info("Démarrage à froid : lancement du processus non mesurable sur ce système")
+        return None
+    duree = time.time() - debut
+    logger.info("Démarrage à froid : première page affichée %.2f s après le lancement du processus", duree)
+    return duree
+
+# Mesures affichées uniquement sur demande, avec ?diagnostic=1 dans l'adresse
+def afficher_diagnostic(*lignes):
+    if st.query_params.get('diagnostic') == '1':
+        for ligne in lignes:
+            st.caption(ligne)
+
+# Les fonctions mises en cache sont identifiées par l'empreinte du fichier ;
+# les arguments préfixés par « _ » ne sont pas hachés par Streamlit, ce qui
+# évite de re-hacher des DataFrames de plusieurs millions de lignes à chaque exécution.
+def empreinte_fichier(fichier):
+    return hashlib.sha1(fichier.getvalue()).hexdigest()
+
+# Lecture du fichier partagée entre les exécutions (non copiée) : le DataFrame ne doit pas être modifié.
+# Le cache est commun à toutes les sessions : max_entries borne la mémoire occupée.
+@st.cache_resource(show_spinner="📂 Lecture du fichier Excel...", max_entries=4)
+def lire_excel(empreinte, _contenu):
+    import pandas as pd
+    return pd.read_excel(BytesIO(_contenu))
+
+# Contrôle de qualité partagé entre les exécutions (non copié) : recalculé uniquement pour un nouveau fichier
+@st.cache_resource(show_spinner="🧪 Contrôle de qualité des données...", max_entries=4)
+def controler_qualite(empreinte, _df):
+    from validation_donnees import valider_donnees
+    resume, anomalies = valider_donnees(_df)
+    return resume, anomalies, anomalies['Position'].nunique()
+
+# Index des élèves partagé entre les exécutions (non copié à chaque accès), borné à 4 fichiers
+@st.cache_resource(show_spinner="👥 Indexation des élèves...", max_entries=4)
+def indexer_eleves(empreinte, _df):
+    from index_eleves import IndexEleves
+    index = IndexEleves(_df)
+    return index, index.multi_inscriptions(_df)
+
+# Agrégats d'une année, mis en cache séparément pour chaque fichier (lecture seule, non copiés)
+@st.cache_resource(show_spinner="📅 Agrégation de l'année...", max_entries=4)
+def resumer_fichier(empreinte, _df):
+    from comparaison_annees import resumer_annee
+    return resumer_annee(_df)
+
+# Comparaison des résumés : recalculée uniquement si l'un des deux fichiers change ;
+# les résumés annuels ne sont consultés qu'en cas d'absence dans ce cache
+@st.cache_resource(show_spinner="📅 Comparaison des deux années...", max_entries=4)
+def comparer_fichiers(empreinte_precedent, empreinte_courant, _df_precedent, _df_courant):
+    from comparaison_annees import comparer_annees, flux_eleves
+    agregats_precedent, ids_precedent = resumer_fichier(empreinte_precedent, _df_precedent)
+    agregats_courant, ids_courant = resumer_fichier(empreinte_courant, _df_courant)
+    return comparer_annees(agregats_precedent, agregats_courant), flux_eleves(ids_precedent, ids_courant)
+
 st.title("🏫 Analyse des Établissements Scolaires - Marrakech-Asafi")
 st.markdown("---")
 
@@ -25,8 +108,21 @@ uploaded_file = st.sidebar.file_uploader(
 
 if uploaded_file is not None:
     try:
+        # Chargement de plotly en arrière-plan pendant la lecture du fichier
+        debut_imports = time.perf_counter()
+        chargement_plotly = None
+        if 'plotly.express' not in sys.modules:
+            chargement_plotly = threading.Thread(
+                target=importlib.import_module, args=('plotly.express',), daemon=True
+            )
+            chargement_plotly.start()
+        
+        import numpy as np
+        import pandas as pd
+        
         # Chargement des données
-        df = pd.read_excel(uploaded_file)
+        empreinte = empreinte_fichier(uploaded_file)
+        df = lire_excel(empreinte, uploaded_file.getvalue())
         
         # Vérification des colonnes requises
         required_columns = ['NOM_ETABL', 'cd_com', 'CD_MIL', 'LL_MIL', 'll_com', 
@@ -39,11 +135,24 @@ if uploaded_file is not None:
             st.error(f"Colonnes manquantes: {missing_columns}")
             st.stop()
         
+        duree_chargement = time.perf_counter() - debut_imports
+        logger.info("Fichier chargé en %.2f s (pandas, lecture Excel)", duree_chargement)
+        
         # Affichage des informations générales
         st.sidebar.success(f"✅ Fichier chargé avec succès!")
         st.sidebar.info(f"📊 **{len(df)}** lignes de données")
         st.sidebar.info(f"🏫 **{df['NOM_ETABL'].nunique()}** établissements uniques")
         
+        # Contrôle de qualité sur les données brutes (avant remplissage des valeurs manquantes)
+        resume_qualite, anomalies_qualite, lignes_anomalies = controler_qualite(empreinte, df)
+        if lignes_anomalies > 0:
+            st.sidebar.warning(f"🧪 **{lignes_anomalies}** lignes avec anomalies (voir l'onglet Qualité)")
+        else:
+            st.sidebar.success("🧪 Aucune anomalie détectée")
+        
+        # Index id_eleve -> lignes, utilisé pour la recherche et le comptage des élèves distincts
+        index_eleves, multi_inscriptions = indexer_eleves(empreinte, df)
+        
         # Filtrage pour Marrakech-Asafi
         if 'll_com' in df.columns:
             marrakech_asafi_keywords = ['marrakech', 'asafi', 'safi', 'marrakesh']
@@ -115,15 +224,49 @@ if uploaded_file is not None:
         st.sidebar.subheader("📊 Données Filtrées")
         st.sidebar.info(f"📊 **{len(df_filtered)}** lignes")
         st.sidebar.info(f"🏫 **{df_filtered['NOM_ETABL'].nunique()}** établissements")
-        st.sidebar.info(f"👥 **{df_filtered['id_eleve'].nunique()}** élèves")
+        st.sidebar.info(f"👥 **{index_eleves.nb_eleves(df_filtered.index)}** élèves")
+        
+        # Comparaison avec une autre année scolaire
+        st.sidebar.markdown("---")
+        st.sidebar.subheader("📅 Comparaison Annuelle")
+        fichier_precedent = st.sidebar.file_uploader(
+            "Fichier de l'année précédente (optionnel)",
+            type=['xlsx', 'xls'],
+            help="Téléchargez l'export de l'année précédente, avec les mêmes colonnes"
+        )
+        
+        df_precedent = None
+        if fichier_precedent is not None:
+            empreinte_precedent = empreinte_fichier(fichier_precedent)
+            df_precedent = lire_excel(empreinte_precedent, fichier_precedent.getvalue())
+            colonnes_manquantes_precedent = [col for col in required_columns if col not in df_precedent.columns]
+            
+            if colonnes_manquantes_precedent:
+                st.sidebar.error(f"Colonnes manquantes (année précédente): {colonnes_manquantes_precedent}")
+                df_precedent = None
+            else:
+                st.sidebar.success(f"✅ Année précédente: **{len(df_precedent)}** lignes")
+        
+        # plotly n'est attendu qu'ici, juste avant le premier graphique : son import
+        # s'est poursuivi pendant la lecture, le contrôle de qualité et l'indexation
+        debut_attente = time.perf_counter()
+        if chargement_plotly is not None:
+            chargement_plotly.join()
+        import plotly.express as px
+        duree_attente_plotly = time.perf_counter() - debut_attente
+        if chargement_plotly is not None:
+            logger.info("Attente de plotly après préparation des données : %.2f s", duree_attente_plotly)
         
         # Onglets principaux
-        tab1, tab2, tab3, tab4, tab5 = st.tabs([
+        tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
             "📊 Vue d'ensemble", 
             "🏫 Analyse Établissements", 
             "👥 Analyse Élèves", 
             "📍 Analyse Provinciale",
-            "📈 Visualisations Personnalisées"
+            "📈 Visualisations Personnalisées",
+            "🧪 Qualité des Données",
+            "🔎 Recherche Élève",
+            "📅 Comparaison Annuelle"
         ])
         
         with tab1:
@@ -135,7 +278,7 @@ if uploaded_file is not None:
                 st.metric("🏫 Établissements", df_filtered['NOM_ETABL'].nunique())
             
             with col2:
-                st.metric("👥 Élèves", df_filtered['id_eleve'].nunique())
+                st.metric("👥 Élèves", index_eleves.nb_eleves(df_filtered.index))
             
             with col3:
                 st.metric("🏛️ Classes", df_filtered['id_classe'].nunique())
@@ -523,6 +666,198 @@ if uploaded_file is not None:
                 except Exception as e:
                     st.error(f"Erreur lors de la création du graphique: {str(e)}")
         
+        with tab6:
+            st.header("🧪 Qualité des Données")
+            st.caption("Contrôles effectués sur l'ensemble du fichier chargé, avant filtrage et remplissage des valeurs manquantes.")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric("📊 Lignes contrôlées", len(df))
+            
+            with col2:
+                st.metric("⚠️ Lignes avec anomalies", lignes_anomalies)
+            
+            with col3:
+                st.metric("📋 Règles en échec", int((resume_qualite['Lignes concernées'] > 0).sum()))
+            
+            # Résumé par règle
+            st.subheader("📋 Résumé des contrôles")
+            st.dataframe(resume_qualite, use_container_width=True)
+            
+            regles_en_echec = resume_qualite[resume_qualite['Lignes concernées'] > 0]
+            
+            if len(regles_en_echec) > 0:
+                fig_qualite = px.bar(
+                    regles_en_echec,
+                    x='Règle',
+                    y='Lignes concernées',
+                    title="Nombre de lignes concernées par règle",
+                    labels={'Règle': 'Règle', 'Lignes concernées': 'Nombre de lignes'}
+                )
+                fig_qualite.update_layout(xaxis_tickangle=-45)
+                st.plotly_chart(fig_qualite, use_container_width=True)
+                
+                # Détail des lignes en anomalie, reconstruit à partir des positions
+                from validation_donnees import detailler_anomalies
+                
+                st.subheader("🔍 Lignes en anomalie")
+                regle_selectionnee = st.selectbox("Règle", ['Toutes'] + regles_en_echec['Règle'].tolist())
+                
+                if regle_selectionnee != 'Toutes':
+                    numero_regle = resume_qualite.index[resume_qualite['Règle'] == regle_selectionnee][0]
+                    anomalies_affichees = anomalies_qualite[anomalies_qualite['Règle'] == numero_regle]
+                else:
+                    anomalies_affichees = anomalies_qualite
+                
+                st.dataframe(
+                    detailler_anomalies(df, resume_qualite, anomalies_affichees.head(1000)),
+                    use_container_width=True
+                )
+                if len(anomalies_affichees) > 1000:
+                    st.caption(f"Affichage des 1000 premières lignes sur {len(anomalies_affichees)}.")
+                
+                # Le fichier CSV n'est construit que sur demande
+                if st.button("📄 Préparer le fichier des anomalies (CSV)"):
+                    with st.spinner("Préparation du fichier..."):
+                        anomalies_csv = detailler_anomalies(df, resume_qualite, anomalies_affichees).to_csv(
+                            index=False
+                        ).encode('utf-8-sig')
+                    
+                    st.download_button(
+                        label="📥 Télécharger les lignes en anomalie (CSV)",
+                        data=anomalies_csv,
+                        file_name="anomalies_qualite.csv",
+                        mime="text/csv"
+                    )
+            else:
+                st.success("✅ Toutes les règles de qualité sont respectées.")
+        
+        with tab7:
+            st.header("🔎 Recherche Élève")
+            st.caption("Recherche sur l'ensemble du fichier chargé, indépendamment des filtres.")
+            
+            id_recherche = st.text_input("Identifiant de l'élève (id_eleve)")
+            
+            if id_recherche:
+                lignes_eleve = index_eleves.lignes(df, id_recherche)
+                
+                if len(lignes_eleve) > 0:
+                    col1, col2, col3 = st.columns(3)
+                    
+                    with col1:
+                        st.metric("📊 Lignes", len(lignes_eleve))
+                    
+                    with col2:
+                        st.metric("🏫 Établissements", lignes_eleve['NOM_ETABL'].nunique())
+                    
+                    with col3:
+                        st.metric("🏛️ Classes", lignes_eleve['id_classe'].nunique())
+                    
+                    st.dataframe(lignes_eleve, use_container_width=True)
+                else:
+                    st.warning(f"Aucun élève trouvé avec l'identifiant « {id_recherche} ».")
+            
+            st.markdown("---")
+            
+            # Élèves inscrits dans plusieurs établissements ou classes
+            st.subheader("👥 Élèves à inscriptions multiples")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric("👥 Élèves indexés", len(index_eleves))
+            
+            with col2:
+                st.metric("🏫 Plusieurs établissements", int((multi_inscriptions['Établissements'] > 1).sum()))
+            
+            with col3:
+                st.metric("🏛️ Plusieurs classes", int((multi_inscriptions['Classes'] > 1).sum()))
+            
+            if len(multi_inscriptions) > 0:
+                st.dataframe(multi_inscriptions.head(1000), use_container_width=True)
+                if len(multi_inscriptions) > 1000:
+                    st.caption(f"Affichage des 1000 premiers élèves sur {len(multi_inscriptions)}.")
+                
+                st.download_button(
+                    label="📥 Télécharger les inscriptions multiples (CSV)",
+                    data=multi_inscriptions.to_csv(index=False).encode('utf-8-sig'),
+                    file_name="inscriptions_multiples.csv",
+                    mime="text/csv"
+                )
+            else:
+                st.success("✅ Aucun élève inscrit dans plusieurs établissements ou classes.")
+        
+        with tab8:
+            st.header("📅 Comparaison Annuelle")
+            
+            if df_precedent is None:
+                st.info("👈 Téléchargez le fichier de l'année précédente dans la barre latérale pour comparer les deux années.")
+            else:
+                st.caption("Comparaison des fichiers complets : année précédente (N-1) et fichier principal (N).")
+                comparaisons, (flux, nouveaux, sortants) = comparer_fichiers(
+                    empreinte_precedent, empreinte, df_precedent, df
+                )
+                
+                # Flux d'élèves entre les deux années
+                st.subheader("👥 Flux d'élèves")
+                
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    st.metric("🔁 Restés", int(flux['Élèves'][0]))
+                
+                with col2:
+                    st.metric("🆕 Nouveaux", int(flux['Élèves'][1]))
+                
+                with col3:
+                    st.metric("🚪 Sortants", int(flux['Élèves'][2]))
+                
+                fig_flux = px.bar(
+                    flux,
+                    x='Flux',
+                    y='Élèves',
+                    color='Flux',
+                    title="Flux d'élèves entre les deux années",
+                    labels={'Flux': 'Flux', 'Élèves': 'Nombre d\'élèves'}
+                )
+                st.plotly_chart(fig_flux, use_container_width=True)
+                
+                flux_export = pd.concat([
+                    pd.DataFrame({'id_eleve': nouveaux, 'Flux': 'Nouveau'}),
+                    pd.DataFrame({'id_eleve': sortants, 'Flux': 'Sortant'})
+                ], ignore_index=True)
+                st.download_button(
+                    label="📥 Télécharger les nouveaux et sortants (CSV)",
+                    data=flux_export.to_csv(index=False).encode('utf-8-sig'),
+                    file_name="flux_eleves.csv",
+                    mime="text/csv"
+                )
+                
+                # Écarts par niveau d'agrégation
+                st.subheader("📊 Écarts entre les deux années")
+                
+                niveau_comparaison = st.selectbox("Comparer par", list(comparaisons.keys()))
+                comparaison = comparaisons[niveau_comparaison]
+                colonne_niveau = comparaison.columns[0]
+                
+                indicateur = st.radio("Indicateur", ['Élèves', 'Classes', 'Établissements'], horizontal=True)
+                
+                ecarts = comparaison.reindex(
+                    comparaison[f'Δ {indicateur}'].abs().sort_values(ascending=False).index
+                ).head(30)
+                fig_ecarts = px.bar(
+                    ecarts,
+                    x=colonne_niveau,
+                    y=f'Δ {indicateur}',
+                    title=f"Écart du nombre de {indicateur.lower()} par {niveau_comparaison.lower()} (30 plus fortes variations)",
+                    labels={colonne_niveau: niveau_comparaison, f'Δ {indicateur}': f'Écart ({indicateur})'}
+                )
+                fig_ecarts.update_layout(xaxis_tickangle=-45)
+                st.plotly_chart(fig_ecarts, use_container_width=True)
+                
+                st.dataframe(comparaison, use_container_width=True)
+        
         # Section de renommage des colonnes
         st.sidebar.markdown("---")
         st.sidebar.subheader("✏️ Renommer les Colonnes")
@@ -557,7 +892,7 @@ if uploaded_file is not None:
             rapport.append("RAPPORT D'ANALYSE - ÉTABLISSEMENTS SCOLAIRES MARRAKECH-ASAFI")
             rapport.append("=" * 70)
             rapport.append(f"Nombre total d'établissements: {df_filtered['NOM_ETABL'].nunique()}")
-            rapport.append(f"Nombre total d'élèves: {df_filtered['id_eleve'].nunique()}")
+            rapport.append(f"Nombre total d'élèves: {index_eleves.nb_eleves(df_filtered.index)}")
             rapport.append(f"Nombre total de classes: {df_filtered['id_classe'].nunique()}")
             rapport.append("")
             
@@ -568,7 +903,7 @@ if uploaded_file is not None:
                 data_milieu = df_filtered[df_filtered['LL_MIL'] == milieu]
                 rapport.append(f"{milieu}:")
                 rapport.append(f"  - Établissements: {data_milieu['NOM_ETABL'].nunique()}")
-                rapport.append(f"  - Élèves: {data_milieu['id_eleve'].nunique()}")
+                rapport.append(f"  - Élèves: {index_eleves.nb_eleves(data_milieu.index)}")
                 rapport.append(f"  - Classes: {data_milieu['id_classe'].nunique()}")
                 rapport.append("")
             
@@ -579,7 +914,7 @@ if uploaded_file is not None:
                 data_type = df_filtered[df_filtered['libformatFr'] == type_etab]
                 rapport.append(f"{type_etab}:")
                 rapport.append(f"  - Établissements: {data_type['NOM_ETABL'].nunique()}")
-                rapport.append(f"  - Élèves: {data_type['id_eleve'].nunique()}")
+                rapport.append(f"  - Élèves: {index_eleves.nb_eleves(data_type.index)}")
                 rapport.append("")
             
             # Statistiques par cycle
@@ -588,7 +923,7 @@ if uploaded_file is not None:
             for cycle in df_filtered['LL_CYCLE'].unique():
                 data_cycle = df_filtered[df_filtered['LL_CYCLE'] == cycle]
                 rapport.append(f"{cycle}:")
-                rapport.append(f"  - Élèves: {data_cycle['id_eleve'].nunique()}")
+                rapport.append(f"  - Élèves: {index_eleves.nb_eleves(data_cycle.index)}")
                 rapport.append("")
             
             rapport_text = "\n".join(rapport)
@@ -604,7 +939,6 @@ if uploaded_file is not None:
             df_export = df_filtered.copy()
             
             # Convertir en bytes pour le téléchargement
-            from io import BytesIO
             output = BytesIO()
             with pd.ExcelWriter(output, engine='openpyxl') as writer:
                 df_export.to_excel(writer, sheet_name='Données_Filtrées', index=False)
@@ -614,7 +948,7 @@ if uploaded_file is not None:
                     'Métrique': ['Établissements', 'Élèves', 'Classes', 'Communes', 'Types d\'Établ.'],
                     'Valeur': [
                         df_filtered['NOM_ETABL'].nunique(),
-                        df_filtered['id_eleve'].nunique(),
+                        index_eleves.nb_eleves(df_filtered.index),
                         df_filtered['id_classe'].nunique(),
                         df_filtered['ll_com'].nunique(),
                         df_filtered['libformatFr'].nunique()
@@ -639,103 +973,12 @@ if uploaded_file is not None:
             st.text(traceback.format_exc())
 
 else:
-    st.info("👆 Veuillez télécharger votre fichier Excel pour commencer l'analyse.")
-    
-    # Affichage des colonnes attendues
-    st.subheader("📋 Colonnes attendues dans votre fichier Excel:")
-    colonnes_attendues = [
-        "NOM_ETABL", "cd_com", "CD_MIL", "LL_MIL", "ll_com", 
-        "nefstat", "id_eleve", "id_classe", "libformatFr", 
-        "LL_CYCLE"]
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("**Colonnes principales :**")
-        for i, col in enumerate(colonnes_attendues[:6], 1):
-            st.write(f"{i}. **{col}**")
-    
-    with col2:
-        st.markdown("**Colonnes additionnelles :**")
-        for i, col in enumerate(colonnes_attendues[6:], 7):
-            st.write(f"{i}. **{col}**")
-    
-    st.markdown("---")
-    st.subheader("🎯 Fonctionnalités principales de l'application:")
-    
-    features = [
-        "**📊 Vue d'ensemble**: Statistiques générales et répartition urbain/rural",
-        "**🏫 Analyse Établissements**: Analyse par nom d'établissement, type et milieu",
-        "**👥 Analyse Élèves**: Répartition des élèves par niveau et type d'établissement",
-        "**📍 Analyse Provinciale**: Statistiques détaillées par province",
-        "**📈 Visualisations Personnalisées**: Créez vos propres graphiques",
-        "**🔍 Filtres Hiérarchiques**: Filtrage par Milieu → Commune → Établissement → Type → Cycle → Niveau",
-        "**✏️ Renommage des Colonnes**: Personnalisez les noms des colonnes",
-        "**💾 Export des Données**: Téléchargez les rapports et données filtrées"
-    ]
-    
-    for feature in features:
-        st.markdown(f"- {feature}")
-    
-    st.markdown("---")
-    st.subheader("🔍 Guide d'utilisation des filtres hiérarchiques:")
-    
-    st.markdown("""
-    1. **🌆 Milieu**: Sélectionnez Rural ou Urbain pour filtrer les établissements
-    2. **🏘️ Commune**: Les communes disponibles dépendent du milieu sélectionné
-    3. **🏫 Établissement**: Les établissements affichés correspondent à la commune choisie (par nom)
-    4. **🏛️ Type d'Établissement**: Filtrez par type d'établissement (nouveau filtre)
-    5. **🎓 Cycle**: Filtrez par cycle d'enseignement (Préscolaire, Primaire, Secondaire)
-    6. **📚 Niveau**: Les niveaux disponibles dépendent du cycle sélectionné
-    
-    **Note**: Chaque filtre influence les options disponibles dans les filtres suivants pour maintenir la cohérence des données.
-    """)
-    
-    st.markdown("---")
-    st.subheader("🔄 Identification des élèves:")
-    
-    st.markdown("""
-    L'application identifie automatiquement les élèves en comparant les colonnes :
-    - **id_eleve** : Identifiant principal de l'élève
-    
-    **Critères de détection** :
-    - Un élève est considéré comme identifié si `id_eleve` est renseigné
-    - L'analyse des élèves est disponible par milieu, province, cycle, niveau et type d'établissement
-    - Des statistiques détaillées et des visualisations sont générées automatiquement
-    """)
-    
-    st.markdown("---")
-    st.info("💡 **Conseil**: Assurez-vous que votre fichier Excel contient toutes les colonnes listées ci-dessus pour une analyse complète.")
-    
-    # Exemple de structure de données
-    st.subheader("📋 Exemple de structure des données:")
-    
-    exemple_data = {
-        'NOM_ETABL': ['École Primaire Al-Wifaq', 'Collège Ibn Battuta', 'École Maternelle Les Palmiers'],
-        'LL_MIL': ['URBAIN', 'RURAL', 'URBAIN'],
-        'll_com': ['MARRAKECH', 'ASAFI', 'MARRAKECH'],
-        'typeEtab': ['École Primaire', 'Collège', 'École Maternelle'],
-        'LL_CYCLE': ['PRIMAIRE', 'SECONDAIRE-COLLEGIAL', 'PRESCOLAIRE'],
-        'libformatFr': ['1° Année Primaire Général', '1° Année Secondaire Collégial Général', 'PRESCOLAIRE'],
-        'id_eleve': ['ELV001', 'ELV002', 'ELV003']
-    }
-    
-    exemple_df = pd.DataFrame(exemple_data)
-    st.dataframe(exemple_df, use_container_width=True)
-    
-    st.markdown("---")
-    st.subheader("🆕 Nouveautés dans cette version:")
-    
-    nouveautes = [
-        "**🏫 NOM_ETABL**: Affichage du nom complet des établissements au lieu des codes",
-        "**🏛️ typeEtab**: Nouveau filtre et analyses par type d'établissement",
-        "**📊 Visualisations enrichies**: Graphiques incluant les types d'établissements",
-        "**🔍 Filtres améliorés**: Filtre hiérarchique par type d'établissement",
-        "**📈 Analyses détaillées**: Statistiques croisées par type, milieu et cycle"
-    ]
-    
-    for nouveaute in nouveautes:
-        st.markdown(f"- {nouveaute}")
-        
-    st.markdown("---")
-    st.markdown("**📞 Support**: Pour toute question sur l'utilisation de cette application, consultez la documentation ou contactez l'équipe technique.")
\ No newline at end of file
+    from accueil import afficher_accueil
+    afficher_accueil()
+
+# Mesures de démarrage : journalisées, affichées seulement en mode diagnostic
+duree_demarrage = mesurer_demarrage()
+afficher_diagnostic(
+    f"⏱️ Exécution du script : {(time.perf_counter() - debut_execution) * 1000:.0f} ms",
+    "⏱️ Démarrage à froid : " + ("non mesurable" if duree_demarrage is None else f"{duree_demarrage:.2f} s"),
+)
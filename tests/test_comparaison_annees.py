@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+from comparaison_annees import comparer_annees, flux_eleves, resumer_annee
+
+
+def _annee(communes, etablissements, classes, eleves):
+    return pd.DataFrame({
+        'll_com': communes,
+        'NOM_ETABL': etablissements,
+        'LL_CYCLE': ['PRIMAIRE'] * len(communes),
+        'libformatFr': ['1AP'] * len(communes),
+        'id_classe': classes,
+        'id_eleve': eleves,
+    })
+
+
+def _flux(df_precedent, df_courant):
+    resume, nouveaux, sortants = flux_eleves(resumer_annee(df_precedent)[1], resumer_annee(df_courant)[1])
+    return dict(zip(resume['Flux'], resume['Élèves'])), list(nouveaux), list(sortants)
+
+
+def test_ecarts_par_commune():
+    precedent = _annee(['A', 'A', 'B'], ['E1', 'E2', 'E3'], [1, 2, 3], [1, 2, 3])
+    courant = _annee(['A', 'C'], ['E1', 'E4'], [1, 4], [1, 4])
+
+    comparaison = comparer_annees(resumer_annee(precedent)[0], resumer_annee(courant)[0])
+    communes = comparaison['Commune'].set_index('ll_com')
+
+    assert communes.loc['A', 'Δ Établissements'] == -1
+    assert communes.loc['B', 'Élèves (N)'] == 0
+    assert communes.loc['C', 'Δ Élèves'] == 1
+
+
+def test_flux_identifiants_float_et_entiers():
+    # Un vide fait lire la colonne en float64 ; l'autre année est lue en int64
+    precedent = _annee(['A'] * 4, ['E1'] * 4, [1, 2, 3, 4], [1.0, 2.0, np.nan, 3.0])
+    courant = _annee(['A'] * 3, ['E1'] * 3, [1, 2, 3], [1, 2, 4])
+
+    flux, nouveaux, sortants = _flux(precedent, courant)
+
+    assert flux == {'Restés': 2, 'Nouveaux': 1, 'Sortants': 1}
+    assert nouveaux == [4]
+    assert sortants == [3]
+
+
+def test_flux_identifiants_texte_et_nombres():
+    precedent = _annee(['A'] * 2, ['E1'] * 2, [1, 2], ['1', '2'])
+    courant = _annee(['A'] * 2, ['E1'] * 2, [1, 2], [2, 3])
+
+    flux, nouveaux, sortants = _flux(precedent, courant)
+
+    assert flux == {'Restés': 1, 'Nouveaux': 1, 'Sortants': 1}
+    assert nouveaux == ['3']
+    assert sortants == ['1']
@@ -0,0 +1,54 @@
+import pandas as pd
+
+from index_eleves import IndexEleves
+
+
+def _df():
+    return pd.DataFrame({
+        'id_eleve': ['A', 'B', 'A', None, 'C', 'B'],
+        'NOM_ETABL': ['X', 'X', 'Y', 'X', 'Z', 'X'],
+        'id_classe': [1, 2, 3, 4, 5, 6],
+    })
+
+
+def test_positions_et_recherche():
+    df = _df()
+    index = IndexEleves(df)
+
+    assert index.positions('A').tolist() == [0, 2]
+    assert index.positions('inconnu').tolist() == []
+    assert index.lignes(df, 'B')['id_classe'].tolist() == [2, 6]
+
+
+def test_nb_eleves_sur_sous_ensemble():
+    df = _df()
+    index = IndexEleves(df)
+
+    assert index.nb_eleves() == 3
+    assert index.nb_eleves(df.index[df['NOM_ETABL'] == 'X']) == 2
+
+
+def test_multi_inscriptions():
+    df = _df()
+    rapport = IndexEleves(df).multi_inscriptions(df).set_index('id_eleve')
+
+    assert sorted(rapport.index) == ['A', 'B']
+    assert rapport.loc['A', 'Liste des établissements'] == 'X | Y'
+    assert rapport.loc['B', 'Établissements'] == 1
+    assert rapport.loc['B', 'Classes'] == 2
+
+
+def test_multi_inscriptions_etablissement_manquant():
+    df = pd.DataFrame({'id_eleve': ['A', 'A'], 'NOM_ETABL': ['X', None], 'id_classe': [1, 2]})
+    rapport = IndexEleves(df).multi_inscriptions(df)
+
+    assert rapport['id_eleve'].tolist() == ['A']
+    assert rapport['Liste des établissements'].tolist() == ['X']
+
+
+def test_multi_inscriptions_sans_etablissement():
+    df = pd.DataFrame({'id_eleve': ['A', 'A'], 'NOM_ETABL': [None, None], 'id_classe': [1, 2]})
+    rapport = IndexEleves(df).multi_inscriptions(df)
+
+    assert rapport['Classes'].tolist() == [2]
+    assert rapport['Liste des établissements'].isna().all()
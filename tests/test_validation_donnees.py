@@ -0,0 +1,47 @@
+import pandas as pd
+
+from validation_donnees import detailler_anomalies, valider_donnees
+
+COLONNES = ['NOM_ETABL', 'cd_com', 'CD_MIL', 'LL_MIL', 'll_com',
+            'nefstat', 'id_eleve', 'id_classe', 'typeEtab',
+            'libformatFr', 'LL_CYCLE']
+
+
+def _lignes_par_regle(resume):
+    return dict(zip(resume['Règle'], resume['Lignes concernées']))
+
+
+def test_fichier_vide():
+    resume, anomalies = valider_donnees(pd.DataFrame(columns=COLONNES))
+
+    assert (resume['Lignes concernées'] == 0).all()
+    assert len(anomalies) == 0
+
+
+def test_milieu_incoherent_dans_les_deux_sens():
+    df = pd.DataFrame({
+        'NOM_ETABL': ['A', 'B', 'C', 'D'],
+        'cd_com': [1, 1, 2, 2],
+        'CD_MIL': [1, 1, 1, 2],
+        'LL_MIL': ['URBAIN', 'RURAL', 'URBAIN', 'URBAIN'],
+        'll_com': ['MARRAKECH', 'MARRAKECH', 'SAFI', 'SAFI'],
+        'id_eleve': ['e1', 'e2', 'e3', 'e4'],
+        'id_classe': ['c1', 'c2', 'c3', 'c4'],
+        'libformatFr': ['n1', 'n1', 'n1', 'n1'],
+    })
+
+    resume, anomalies = valider_donnees(df)
+    lignes = _lignes_par_regle(resume)
+
+    # Commune 1 : un code, deux libellés ; commune 2 : un libellé, deux codes
+    assert lignes["Code milieu avec plusieurs libellés dans la commune"] == 2
+    assert lignes["Libellé milieu avec plusieurs codes dans la commune"] == 2
+    assert sorted(anomalies['Position'].unique()) == [0, 1, 2, 3]
+
+    detail = detailler_anomalies(df, resume, anomalies)
+    assert len(detail) == len(anomalies)
+    assert sorted(detail['Ligne'].unique()) == [2, 3, 4, 5]
+    assert set(detail['Règle']) == {
+        "Code milieu avec plusieurs libellés dans la commune",
+        "Libellé milieu avec plusieurs codes dans la commune",
+    }
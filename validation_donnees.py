@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+
+from codage import compter_valeurs_distinctes
+
+# Règles de cohérence : chaque clé doit correspondre à une seule valeur
+REGLES_COHERENCE = [
+    {
+        'regle': "Élève dans plusieurs établissements",
+        'cles': ['id_eleve'],
+        'valeur': 'NOM_ETABL',
+    },
+    {
+        'regle': "Classe associée à plusieurs niveaux",
+        'cles': ['id_classe'],
+        'valeur': 'libformatFr',
+    },
+    {
+        'regle': "Code milieu avec plusieurs libellés dans la commune",
+        'cles': ['cd_com', 'CD_MIL'],
+        'valeur': 'LL_MIL',
+    },
+    {
+        'regle': "Libellé milieu avec plusieurs codes dans la commune",
+        'cles': ['cd_com', 'LL_MIL'],
+        'valeur': 'CD_MIL',
+    },
+    {
+        'regle': "Code commune avec plusieurs libellés",
+        'cles': ['cd_com'],
+        'valeur': 'll_com',
+    },
+    {
+        'regle': "Libellé commune avec plusieurs codes",
+        'cles': ['ll_com'],
+        'valeur': 'cd_com',
+    },
+]
+
+# Colonnes qui ne doivent jamais être vides
+COLONNES_OBLIGATOIRES = ['id_eleve', 'id_classe', 'NOM_ETABL', 'cd_com', 'll_com']
+
+
+def _combiner_codes(codes_cles):
+    # Fusionne plusieurs colonnes codées en un seul code entier (-1 si une valeur manque)
+    cle = codes_cles[0]
+    for codes in codes_cles[1:]:
+        manquant = (cle < 0) | (codes < 0)
+        nb_codes = codes.max() + 1 if len(codes) else 1
+        cle = cle.astype(np.int64) * nb_codes + codes
+        cle[manquant] = -1
+        cle = pd.factorize(cle)[0]
+        cle[manquant] = -1
+    return cle
+
+
+def _masque_incoherence(codes, cles, valeur):
+    # Lignes dont la clé est associée à plus d'une valeur distincte
+    cle = _combiner_codes([codes[col] for col in cles])
+    val = codes[valeur]
+    valide = (cle >= 0) & (val >= 0)
+    if not valide.any():
+        return cle, valide
+
+    cle_multiple = compter_valeurs_distinctes(cle, val, cle.max() + 1) > 1
+
+    return cle, valide & cle_multiple[np.where(cle >= 0, cle, 0)]
+
+
+def valider_donnees(df):
+    """Applique toutes les règles de qualité en une passe vectorisée.
+
+    Retourne un tuple (resume, anomalies) : le résumé par règle et les
+    anomalies sous forme compacte, une ligne par couple ligne/règle avec la
+    position de la ligne dans `df` et le numéro de la règle dans `resume`.
+    Le détail des lignes est construit à la demande par detailler_anomalies.
+    """
+    colonnes = set(COLONNES_OBLIGATOIRES)
+    for regle in REGLES_COHERENCE:
+        colonnes.update(regle['cles'])
+        colonnes.add(regle['valeur'])
+
+    # Codage entier de chaque colonne une seule fois, partagé par toutes les règles
+    codes = {col: pd.factorize(df[col])[0] for col in colonnes}
+
+    controles = []
+    for col in COLONNES_OBLIGATOIRES:
+        controles.append((f"Valeur manquante : {col}", [col], None, None, codes[col] < 0))
+    for regle in REGLES_COHERENCE:
+        cle, masque = _masque_incoherence(codes, regle['cles'], regle['valeur'])
+        controles.append((regle['regle'], regle['cles'], regle['valeur'], cle, masque))
+
+    resume = []
+    positions = []
+    numeros = []
+    for numero, (regle, cles, valeur, cle, masque) in enumerate(controles):
+        lignes = np.flatnonzero(masque)
+        nb_cles = len(lignes) if cle is None else len(pd.unique(cle[lignes]))
+        positions.append(lignes)
+        numeros.append(np.full(len(lignes), numero, dtype=np.int16))
+        resume.append({
+            'Règle': regle,
+            'Colonnes': ', '.join(cles + ([valeur] if valeur else [])),
+            'Lignes concernées': len(lignes),
+            'Clés concernées': nb_cles,
+            '% des lignes': round(100 * len(lignes) / len(df), 2) if len(df) else 0.0,
+        })
+
+    resume = pd.DataFrame(resume)
+    anomalies = pd.DataFrame({
+        'Position': np.concatenate(positions).astype(np.int32),
+        'Règle': np.concatenate(numeros),
+    })
+
+    return resume, anomalies
+
+
+def detailler_anomalies(df, resume, anomalies):
+    """Lignes de `df` correspondant aux anomalies compactes, avec leur règle.
+
+    Ne recopie que les lignes demandées : à appeler sur un extrait pour
+    l'affichage, ou sur l'ensemble uniquement pour un export explicite.
+    """
+    positions = anomalies['Position'].to_numpy()
+    lignes = df.iloc[positions].reset_index(drop=True)
+    lignes.insert(0, 'Règle', resume['Règle'].to_numpy()[anomalies['Règle'].to_numpy()])
+    lignes.insert(0, 'Ligne', positions + 2)  # numéro de ligne Excel (en-tête = 1)
+    return lignes